@@ -1,11 +1,53 @@
 -- This script creates the launch_aggregates table if it does not already exist.
 -- This table stores aggregated metrics calculated from the raw_launches table.
+-- Averages are kept as running sums and counts so that each ingestion run can
+-- update them incrementally from the newly inserted launches only.
 
 CREATE TABLE IF NOT EXISTS launch_aggregates (
     id INT PRIMARY KEY,
-    total_launches BIGINT,
-    successful_launches BIGINT,
-    average_payload_mass_kg DOUBLE PRECISION,
-    average_launch_delay_seconds DOUBLE PRECISION,
+    total_launches BIGINT NOT NULL DEFAULT 0,
+    successful_launches BIGINT NOT NULL DEFAULT 0,
+    sum_payload_mass_kg DOUBLE PRECISION NOT NULL DEFAULT 0,
+    count_payload_mass_nonnull BIGINT NOT NULL DEFAULT 0,
+    average_payload_mass_kg DOUBLE PRECISION
+        GENERATED ALWAYS AS (sum_payload_mass_kg / NULLIF(count_payload_mass_nonnull, 0)) STORED,
+    sum_launch_delay_seconds DOUBLE PRECISION NOT NULL DEFAULT 0,
+    count_launch_delay_nonnull BIGINT NOT NULL DEFAULT 0,
+    average_launch_delay_seconds DOUBLE PRECISION
+        GENERATED ALWAYS AS (sum_launch_delay_seconds / NULLIF(count_launch_delay_nonnull, 0)) STORED,
     last_updated_utc TIMESTAMP WITH TIME ZONE
 );
+
+-- Migrate a table created with the earlier layout (stored averages, no running
+-- totals) in place, keeping the table itself and any grants on it. The existing
+-- row is cleared so that the next aggregate update recalculates the running
+-- totals from raw_launches.
+DO $$
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_schema = current_schema()
+          AND table_name = 'launch_aggregates'
+          AND column_name = 'sum_payload_mass_kg'
+    ) THEN
+        DELETE FROM launch_aggregates;
+
+        ALTER TABLE launch_aggregates
+            ALTER COLUMN total_launches SET DEFAULT 0,
+            ALTER COLUMN total_launches SET NOT NULL,
+            ALTER COLUMN successful_launches SET DEFAULT 0,
+            ALTER COLUMN successful_launches SET NOT NULL,
+            ADD COLUMN sum_payload_mass_kg DOUBLE PRECISION NOT NULL DEFAULT 0,
+            ADD COLUMN count_payload_mass_nonnull BIGINT NOT NULL DEFAULT 0,
+            ADD COLUMN sum_launch_delay_seconds DOUBLE PRECISION NOT NULL DEFAULT 0,
+            ADD COLUMN count_launch_delay_nonnull BIGINT NOT NULL DEFAULT 0,
+            DROP COLUMN average_payload_mass_kg,
+            DROP COLUMN average_launch_delay_seconds;
+
+        ALTER TABLE launch_aggregates
+            ADD COLUMN average_payload_mass_kg DOUBLE PRECISION
+                GENERATED ALWAYS AS (sum_payload_mass_kg / NULLIF(count_payload_mass_nonnull, 0)) STORED,
+            ADD COLUMN average_launch_delay_seconds DOUBLE PRECISION
+                GENERATED ALWAYS AS (sum_launch_delay_seconds / NULLIF(count_launch_delay_nonnull, 0)) STORED;
+    END IF;
+END $$;
@@ -3,3 +3,9 @@ CREATE TABLE IF NOT EXISTS raw_launches (
     launch_data JSONB,
     ingested_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
 );
+
+-- Index the launch date so the latest launch can be found with a single index lookup.
+-- The API returns `date_utc` as a uniform ISO 8601 UTC string (e.g. "2020-01-01T00:00:00.000Z"),
+-- so text order matches chronological order. The text value is indexed rather than a
+-- `::timestamptz` cast because that cast is not IMMUTABLE and cannot be used in an index.
+CREATE INDEX IF NOT EXISTS raw_launches_date_utc_idx ON raw_launches ((launch_data->>'date_utc'));
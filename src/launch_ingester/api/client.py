@@ -3,45 +3,84 @@ API Client for the SpaceX Launches API.
 
 This module provides a client to interact with the SpaceX API (specifically,
 the v4 /launches/query endpoint) to fetch launch data. It handles API-side
-pagination to ensure all requested launch records are retrieved.
+pagination, fetching pages concurrently, to ensure all requested launch
+records are retrieved.
 """
 import logging
-from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from pydantic import TypeAdapter, ValidationError
 from launch_ingester.config import API_URL
-from launch_ingester.models.launch import Launch
+from launch_ingester.models.launch import LaunchLite
 
 logger = logging.getLogger(__name__)
 
+# Validates a whole page of launch documents in a single pydantic-core call.
+_LAUNCH_LIST = TypeAdapter(List[LaunchLite])
 
-def query_launches(since_date: Optional[str] = None) -> List[Launch]:
+# Maximum number of pages fetched concurrently after the first one.
+_MAX_WORKERS = 8
+
+# (connect, read) timeouts in seconds, so a stalled connection cannot hang the run.
+_REQUEST_TIMEOUT = (3, 30)
+
+# Retry policy for transient failures. POST is included because the /query
+# endpoint is read-only and therefore safe to repeat.
+_RETRY = Retry(
+    total=5,
+    backoff_factor=0.5,
+    status_forcelist=[429, 500, 502, 503, 504],
+    allowed_methods=frozenset({"POST"}),
+)
+
+# Shared session so that all page requests reuse pooled keep-alive connections.
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(pool_connections=_MAX_WORKERS, pool_maxsize=_MAX_WORKERS, max_retries=_RETRY),
+)
+
+
+def query_launches(
+    since_date: Optional[str] = None, validate: bool = True
+) -> List[Tuple[LaunchLite, Dict]]:
     """
     Fetches launch data from the SpaceX API using the /query endpoint.
 
     This function handles pagination to retrieve all results for the given query.
+    The first page is fetched on its own to learn the total page count; the
+    remaining pages are then fetched concurrently and reassembled in order.
 
     Args:
         since_date: If provided, fetches launches with a `date_utc` greater 
                     than this value. Expected format is an ISO 8601 string
                     (e.g., "2020-01-01T00:00:00.000Z").
+        validate: If False, LaunchLite objects are built without validation. Only
+                  use this for known-good data, such as replaying documents
+                  that were already validated once; the live API path should
+                  keep the default.
 
     Returns:
-        A list of Launch objects validated by Pydantic.
+        A list of `(launch, launch_data)` pairs: the LaunchLite object validated by
+        Pydantic alongside the raw API document it was built from, which is
+        what gets stored in the database.
 
     Raises:
         requests.exceptions.RequestException: For connection errors or bad
                                               HTTP status codes.
     """
-    all_launches: List[Launch] = []
-    page = 1
-    has_next_page = True
+    all_launches: List[Tuple[LaunchLite, Dict]] = []
 
     base_query = {
         "query": {
         },
         "options": {
-            "page": page,
+            "page": 1,
             "limit": 50,
             "sort": {
                 "flight_number": "asc"
@@ -56,31 +95,81 @@ def query_launches(since_date: Optional[str] = None) -> List[Launch]:
     else:
         logger.info("Querying for all launches (backfill).")
 
-    while has_next_page:
-        base_query["options"]["page"] = page
-        logger.info(f"Fetching page {page} of launch data...")
-        
-        try:
-            response = requests.post(API_URL, json=base_query)
-            response.raise_for_status()  # Raises HTTPError for bad responses (4xx or 5xx)
-            data = response.json()
-        except requests.exceptions.RequestException as e:
-            logger.error(f"API request failed on page {page}: {e}")
-            raise
-
-        launches_on_page = data.get("docs", [])
-        logger.info(f"Received {len(launches_on_page)} launches on page {page}.")
-
-        for launch_data in launches_on_page:
-            try:
-                all_launches.append(Launch(**launch_data))
-            except Exception as e:
-                # I don't raise the error on purpose here - prioritizing robustness over correctness
-                launch_id = launch_data.get("id", "N/A")
-                logger.error(f"Pydantic validation failed for launch ID {launch_id}: {e}")
-
-        has_next_page = data.get("hasNextPage", False)
-        page += 1
+    first_page = _fetch_page(base_query, 1)
+    all_launches.extend(_validate_page(first_page.get("docs", []), validate))
+
+    total_pages = first_page.get("totalPages", 1)
+    if total_pages > 1:
+        logger.info(f"Fetching remaining {total_pages - 1} pages with up to {_MAX_WORKERS} workers...")
+        with ThreadPoolExecutor(max_workers=_MAX_WORKERS) as executor:
+            futures = {
+                page: executor.submit(_fetch_page, base_query, page)
+                for page in range(2, total_pages + 1)
+            }
+            docs_by_page = {page: future.result().get("docs", []) for page, future in futures.items()}
+
+        for page in sorted(docs_by_page):
+            all_launches.extend(_validate_page(docs_by_page[page], validate))
     
     logger.info(f"Finished fetching all pages. Total launches retrieved: {len(all_launches)}")
     return all_launches
+
+
+def _fetch_page(base_query: Dict, page: int) -> Dict:
+    """
+    Fetches a single page of results for the given query.
+
+    The shared query is not mutated, so this is safe to call from several
+    threads at once.
+    """
+    query = {**base_query, "options": {**base_query["options"], "page": page}}
+    logger.info(f"Fetching page {page} of launch data...")
+
+    try:
+        response = _SESSION.post(API_URL, json=query, timeout=_REQUEST_TIMEOUT)
+        response.raise_for_status()  # Raises HTTPError for bad responses (4xx or 5xx)
+        data = orjson.loads(response.content)
+    except requests.exceptions.RequestException as e:
+        logger.error(f"API request failed on page {page}: {e}")
+        raise
+    except orjson.JSONDecodeError as e:
+        logger.error(f"API returned invalid JSON on page {page}: {e}")
+        raise
+
+    logger.info(f"Received {len(data.get('docs', []))} launches on page {page}.")
+    return data
+
+
+def _validate_page(
+    launches_on_page: List[Dict], validate: bool = True
+) -> List[Tuple[LaunchLite, Dict]]:
+    """
+    Validates a page of raw launch documents into LaunchLite objects.
+
+    The whole page is validated in one batch; only if that fails does it fall
+    back to validating record by record, so that a single malformed launch is
+    logged and skipped instead of discarding the rest of the page.
+
+    When `validate` is False, objects are built with `model_construct`, which
+    skips validation entirely.
+    """
+    if not validate:
+        return [
+            (LaunchLite.model_construct(**launch_data), launch_data)
+            for launch_data in launches_on_page
+        ]
+
+    try:
+        return list(zip(_LAUNCH_LIST.validate_python(launches_on_page), launches_on_page))
+    except ValidationError:
+        logger.debug("Batch validation failed for page; falling back to per-record validation.")
+
+    validated: List[Tuple[LaunchLite, Dict]] = []
+    for launch_data in launches_on_page:
+        try:
+            validated.append((LaunchLite.model_validate(launch_data), launch_data))
+        except Exception as e:
+            # I don't raise the error on purpose here - prioritizing robustness over correctness
+            launch_id = launch_data.get("id", "N/A")
+            logger.error(f"Pydantic validation failed for launch ID {launch_id}: {e}")
+    return validated
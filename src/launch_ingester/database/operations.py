@@ -2,19 +2,23 @@
 Database Operations for the Launch Ingester.
 
 This module handles all interactions with the PostgreSQL database, including
-establishing connections, creating tables, and inserting data. It uses a
-context manager for safe and efficient connection handling.
+establishing connections, creating tables, and inserting data. Connections are
+checked out of a lazily created, process-wide pool through a context manager
+for safe and efficient connection handling.
 """
 
-import json
+import atexit
+import io
 import logging
-import os
+import struct
 from contextlib import contextmanager
-from typing import Dict, Optional, Iterator
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
 from datetime import datetime
 
+import orjson
 import psycopg2
-from psycopg2 import sql
+from psycopg2.pool import ThreadedConnectionPool
 from psycopg2.extensions import connection, cursor
 
 from launch_ingester.config import (
@@ -27,13 +31,54 @@ from launch_ingester.config import (
 
 logger = logging.getLogger(__name__)
 
+# --- Table Schemas ---
+
+# Schema files live in the project-level `sql/` directory and are read once at import.
+_SQL_DIR = Path(__file__).resolve().parents[3] / "sql"
+_RAW_DDL = (_SQL_DIR / "create_raw_launches_table.sql").read_text()
+_AGG_DDL = (_SQL_DIR / "create_launch_aggregates_table.sql").read_text()
+
+# Set once both tables have been ensured, so later calls skip the round-trip.
+_TABLES_READY = False
+
 # --- Connection Handling ---
 
+_POOL_MIN_CONNECTIONS = 1
+_POOL_MAX_CONNECTIONS = 10
+
+_POOL: Optional[ThreadedConnectionPool] = None
+
+def _get_pool() -> ThreadedConnectionPool:
+    """
+    Returns the process-wide connection pool, creating it on first use.
+
+    Raises:
+        psycopg2.Error: If the initial connections cannot be established.
+    """
+    global _POOL
+    if _POOL is None:
+        logger.debug("Creating PostgreSQL connection pool...")
+        _POOL = ThreadedConnectionPool(
+            minconn=_POOL_MIN_CONNECTIONS,
+            maxconn=_POOL_MAX_CONNECTIONS,
+            dbname=POSTGRES_DB,
+            user=POSTGRES_USER,
+            password=POSTGRES_PASSWORD,
+            host=POSTGRES_HOST,
+            port=POSTGRES_PORT,
+        )
+        atexit.register(_POOL.closeall)
+        logger.debug("Database connection pool created successfully.")
+    return _POOL
+
 @contextmanager
 def get_db_connection() -> Iterator[connection]:
     """
     Provides a managed connection to the PostgreSQL database.
 
+    The connection is checked out of the shared pool and returned to it on
+    exit; broken connections are discarded instead of being reused.
+
     Yields:
         A database connection object.
     
@@ -42,23 +87,18 @@ def get_db_connection() -> Iterator[connection]:
     """
     conn = None
     try:
-        logger.debug("Attempting to connect to the PostgreSQL database...")
-        conn = psycopg2.connect(
-            dbname=POSTGRES_DB,
-            user=POSTGRES_USER,
-            password=POSTGRES_PASSWORD,
-            host=POSTGRES_HOST,
-            port=POSTGRES_PORT,
-        )
-        logger.debug("Database connection established successfully.")
+        logger.debug("Checking out a connection from the pool...")
+        pool = _get_pool()
+        conn = pool.getconn()
+        logger.debug("Database connection checked out successfully.")
         yield conn
     except psycopg2.Error as e:
         logger.error(f"Database connection error: {e}")
         raise
     finally:
         if conn:
-            conn.close()
-            logger.debug("Database connection closed.")
+            pool.putconn(conn, close=bool(conn.closed))
+            logger.debug("Database connection returned to the pool.")
 
 @contextmanager
 def get_cursor(conn: connection) -> Iterator[cursor]:
@@ -83,102 +123,165 @@ def get_cursor(conn: connection) -> Iterator[cursor]:
 
 # --- Database Functions ---
 
-def create_raw_launches_table() -> None:
-    """Creates the `raw_launches` table in the database if it does not exist."""
-    # Construct an absolute path to the SQL file relative to this script's location
-    current_dir = os.path.dirname(os.path.abspath(__file__))
-    sql_file_path = os.path.join(current_dir, "../../../sql/create_raw_launches_table.sql")
-    
-    logger.info("Ensuring 'raw_launches' table exists...")
-    try:
-        with get_db_connection() as conn, get_cursor(conn) as cur:
-            logger.debug(f"Reading table schema from {sql_file_path}")
-            with open(sql_file_path, "r") as f:
-                cur.execute(f.read())
-            logger.info("'raw_launches' table is ready.")
-    except (IOError, psycopg2.Error) as e:
-        logger.error(f"Failed to create 'raw_launches' table: {e}")
-        raise
+def _ensure_tables(cur: cursor) -> None:
+    """
+    Applies the `raw_launches` and `launch_aggregates` schemas on an open cursor.
 
-def get_latest_launch_date() -> Optional[datetime]:
+    Skipped once the tables have been ensured in this process; the caller marks
+    them ready after the transaction commits.
     """
-    Retrieves the most recent launch date (UTC) from the `raw_launches` table.
+    if _TABLES_READY:
+        logger.debug("Tables already ensured in this process, skipping.")
+        return
+    cur.execute(_RAW_DDL)
+    cur.execute(_AGG_DDL)
+
+# Ordered by the raw `date_utc` text so the planner can read the latest row
+# straight off `raw_launches_date_utc_idx` instead of scanning the table.
+_LATEST_DATE_QUERY = """
+    SELECT (launch_data->>'date_utc')::timestamptz
+    FROM raw_launches
+    WHERE launch_data->>'date_utc' IS NOT NULL
+    ORDER BY launch_data->>'date_utc' DESC
+    LIMIT 1;
+"""
+
+def prepare_and_get_state() -> Optional[datetime]:
+    """
+    Ensures both tables exist and retrieves the most recent launch date (UTC).
+
+    Table creation and the latest-date query run in a single transaction on
+    one connection, which is all the ingestion start-up needs.
 
     Returns:
         The most recent launch date as a timezone-aware datetime object,
         or None if the table is empty.
     """
-    logger.info("Querying for the most recent launch date in the database.")
-    query = "SELECT MAX((launch_data->>'date_utc')::timestamptz) FROM raw_launches;"
-    
+    global _TABLES_READY
+    logger.info("Ensuring tables exist and querying for the most recent launch date.")
     try:
         with get_db_connection() as conn, get_cursor(conn) as cur:
-            cur.execute(query)
-            latest_date = cur.fetchone()[0]
-            if latest_date:
-                logger.info(f"Most recent launch date found: {latest_date.isoformat()}")
-            else:
-                logger.info("No existing data found in 'raw_launches' table.")
-            return latest_date
+            _ensure_tables(cur)
+            cur.execute(_LATEST_DATE_QUERY)
+            row = cur.fetchone()
+        _TABLES_READY = True
     except psycopg2.Error as e:
-        logger.error(f"Failed to query for latest launch date: {e}")
+        logger.error(f"Failed to prepare tables and query for latest launch date: {e}")
         raise
 
-def insert_launch_data(launch_data: Dict) -> None:
+    latest_date = row[0] if row else None
+    if latest_date:
+        logger.info(f"Most recent launch date found: {latest_date.isoformat()}")
+    else:
+        logger.info("No existing data found in 'raw_launches' table.")
+    return latest_date
+
+# Header of PostgreSQL's binary COPY format: signature, flags field, header extension length.
+_COPY_BINARY_HEADER = b"PGCOPY\n\xff\r\n\x00" + struct.pack("!ii", 0, 0)
+_COPY_BINARY_TRAILER = struct.pack("!h", -1)
+# Version byte that prefixes the binary representation of a `jsonb` value.
+_JSONB_BINARY_VERSION = b"\x01"
+
+def _build_copy_binary_buffer(launches: List[Dict]) -> io.BytesIO:
     """
-    Inserts a new launch record into the `raw_launches` table.
-    
-    If a launch with the same ID already exists, it is ignored thanks to the
-    `ON CONFLICT (id) DO NOTHING` clause in the query.
+    Encodes launches as a binary COPY stream of `(id text, launch_data jsonb)` rows.
+
+    Each field is written as a length-prefixed value, so the serialized JSON
+    never needs to be escaped the way the text format requires.
+    """
+    buffer = io.BytesIO()
+    buffer.write(_COPY_BINARY_HEADER)
+    for launch_data in launches:
+        launch_id = str(launch_data.get("id")).encode()
+        payload = _JSONB_BINARY_VERSION + orjson.dumps(launch_data)
+        buffer.write(struct.pack("!h", 2))
+        buffer.write(struct.pack("!i", len(launch_id)))
+        buffer.write(launch_id)
+        buffer.write(struct.pack("!i", len(payload)))
+        buffer.write(payload)
+    buffer.write(_COPY_BINARY_TRAILER)
+    buffer.seek(0)
+    return buffer
+
+def bulk_copy_launches(launches: List[Dict], newer_than: Optional[datetime] = None) -> List[str]:
+    """
+    Bulk-loads launch records into the `raw_launches` table using COPY and
+    adds them to the running totals in `launch_aggregates`.
+
+    All rows are streamed in a single binary `COPY ... FROM STDIN` into a temporary
+    staging table, then moved into `raw_launches` with one
+    `INSERT ... ON CONFLICT (id) DO NOTHING`, so existing launches are skipped
+    in one round-trip. The aggregates are updated from the inserted rows in the
+    same transaction, so a launch is never stored without being counted.
+    Launches repeated in the input are loaded and counted once.
 
     Args:
-        launch_data: A dictionary representing the launch data to insert.
+        launches: A list of dictionaries representing the launches to insert.
+        newer_than: If provided, only launches whose `date_utc` is strictly
+                    after this timestamp are inserted. The comparison is done
+                    by PostgreSQL on the staged rows.
+
+    Returns:
+        The IDs of the launches actually inserted.
     """
-    insert_query = sql.SQL(
-        "INSERT INTO raw_launches (id, launch_data) VALUES (%s, %s) ON CONFLICT (id) DO NOTHING;"
-    )
-    launch_id = launch_data.get("id")
-    
-    logger.debug(f"Attempting to insert launch with ID: {launch_id}")
+    if not launches:
+        return []
+
+    unique_launches = {launch_data.get("id"): launch_data for launch_data in launches}
+    if len(unique_launches) < len(launches):
+        logger.debug(f"Dropped {len(launches) - len(unique_launches)} duplicate launches from the input.")
+    launches = list(unique_launches.values())
+
+    buffer = _build_copy_binary_buffer(launches)
+
+    logger.debug(f"Copying {len(launches)} launches into staging table...")
     try:
         with get_db_connection() as conn, get_cursor(conn) as cur:
-            cur.execute(insert_query, (launch_id, json.dumps(launch_data)))
-            if cur.rowcount > 0:
-                logger.debug(f"Successfully inserted launch ID: {launch_id}")
+            cur.execute(
+                "CREATE TEMP TABLE raw_launches_stage "
+                "(LIKE raw_launches INCLUDING DEFAULTS) ON COMMIT DROP;"
+            )
+            cur.copy_expert(
+                "COPY raw_launches_stage (id, launch_data) FROM STDIN WITH (FORMAT BINARY)",
+                buffer,
+            )
+            if newer_than:
+                cur.execute(
+                    "INSERT INTO raw_launches SELECT s.* FROM raw_launches_stage s "
+                    "WHERE (s.launch_data->>'date_utc')::timestamptz > %s "
+                    "ON CONFLICT (id) DO NOTHING RETURNING id;",
+                    (newer_than,),
+                )
             else:
-                logger.debug(f"Launch ID already exists, skipped: {launch_id}")
+                cur.execute(
+                    "INSERT INTO raw_launches SELECT * FROM raw_launches_stage "
+                    "ON CONFLICT (id) DO NOTHING RETURNING id;"
+                )
+            inserted_ids = [row[0] for row in cur.fetchall()]
+            logger.debug(
+                f"Inserted {len(inserted_ids)} of {len(launches)} launches "
+                f"({len(launches) - len(inserted_ids)} already existed or were not newer)."
+            )
+            _apply_aggregate_deltas(cur, [unique_launches[launch_id] for launch_id in inserted_ids])
+            return inserted_ids
     except psycopg2.Error as e:
-        logger.error(f"Failed to insert launch data for ID {launch_id}: {e}")
+        logger.error(f"Failed to bulk copy launch data: {e}")
         raise
 
-def create_launch_aggregates_table() -> None:
-    """Creates the `launch_aggregates` table in the database if it does not exist."""
-    current_dir = os.path.dirname(os.path.abspath(__file__))
-    sql_file_path = os.path.join(current_dir, "../../../sql/create_launch_aggregates_table.sql")
-    
-    logger.info("Ensuring 'launch_aggregates' table exists...")
-    try:
-        with get_db_connection() as conn, get_cursor(conn) as cur:
-            logger.debug(f"Reading table schema from {sql_file_path}")
-            with open(sql_file_path, "r") as f:
-                cur.execute(f.read())
-            logger.info("'launch_aggregates' table is ready.")
-    except (IOError, psycopg2.Error) as e:
-        logger.error(f"Failed to create 'launch_aggregates' table: {e}")
-        raise
-
-def update_launch_aggregates() -> None:
+def _recalculate_aggregates(cur: cursor) -> None:
     """
-    Calculates aggregated launch metrics and updates the `launch_aggregates` table.
+    Recalculates aggregated launch metrics from scratch on an open cursor.
 
-    This function computes the following metrics from the `raw_launches` table:
+    This function computes the following metrics from the whole `raw_launches` table:
     - Total number of launches.
     - Total number of successful launches.
-    - Average payload mass (in kg).
+    - Running sum and count of payload mass (in kg), from which the average is derived.
+    - Running sum and count of launch delay (in seconds), from which the average is derived.
 
     The results are then inserted or updated into the `launch_aggregates` table.
+    This is a full scan, only needed when the aggregate row does not exist yet.
     """
-    logger.info("Updating launch aggregates table...")
+    logger.info("Recalculating launch aggregates table from all raw launches...")
     aggregation_query = """
         WITH launch_metrics AS (
             SELECT
@@ -195,30 +298,107 @@ def update_launch_aggregates() -> None:
             id,
             total_launches,
             successful_launches,
-            average_payload_mass_kg,
-            average_launch_delay_seconds,
+            sum_payload_mass_kg,
+            count_payload_mass_nonnull,
+            sum_launch_delay_seconds,
+            count_launch_delay_nonnull,
             last_updated_utc
         )
         SELECT
             1 AS id,
             COUNT(*) AS total_launches,
-            SUM(CASE WHEN success THEN 1 ELSE 0 END) AS successful_launches,
-            AVG(total_mass_kg) AS average_payload_mass_kg,
-            AVG(launch_delay_seconds) AS average_launch_delay_seconds,
+            COALESCE(SUM(CASE WHEN success THEN 1 ELSE 0 END), 0) AS successful_launches,
+            COALESCE(SUM(total_mass_kg), 0) AS sum_payload_mass_kg,
+            COUNT(total_mass_kg) AS count_payload_mass_nonnull,
+            COALESCE(SUM(launch_delay_seconds), 0) AS sum_launch_delay_seconds,
+            COUNT(launch_delay_seconds) AS count_launch_delay_nonnull,
             NOW() AS last_updated_utc
         FROM
             launch_metrics
         ON CONFLICT (id) DO UPDATE SET
             total_launches = EXCLUDED.total_launches,
             successful_launches = EXCLUDED.successful_launches,
-            average_payload_mass_kg = EXCLUDED.average_payload_mass_kg,
-            average_launch_delay_seconds = EXCLUDED.average_launch_delay_seconds,
+            sum_payload_mass_kg = EXCLUDED.sum_payload_mass_kg,
+            count_payload_mass_nonnull = EXCLUDED.count_payload_mass_nonnull,
+            sum_launch_delay_seconds = EXCLUDED.sum_launch_delay_seconds,
+            count_launch_delay_nonnull = EXCLUDED.count_launch_delay_nonnull,
             last_updated_utc = EXCLUDED.last_updated_utc;
     """
-    
+    cur.execute(aggregation_query)
+
+def _launch_payload_mass_kg(launch_data: Dict) -> Optional[float]:
+    """
+    Returns the total payload mass of a launch, or None if no payload has a known mass.
+
+    Mirrors the per-launch `SUM(mass_kg)` in `_recalculate_aggregates`.
+    """
+    masses = [
+        payload["mass_kg"]
+        for payload in launch_data.get("payloads") or []
+        if isinstance(payload, dict) and payload.get("mass_kg") is not None
+    ]
+    return float(sum(masses)) if masses else None
+
+def _apply_aggregate_deltas(cur: cursor, new_launches: List[Dict]) -> None:
+    """
+    Adds newly inserted launches to the running totals in `launch_aggregates`.
+
+    Only the given launches are read, so the cost is proportional to the size
+    of the run rather than the whole `raw_launches` table. If the aggregate
+    row does not exist yet (first run, or the table was just rebuilt), a full
+    recalculation is performed instead.
+
+    Args:
+        cur: A cursor in the transaction that inserted `new_launches`.
+        new_launches: The launch dictionaries that were actually inserted into
+                      `raw_launches`, without duplicates. May be empty.
+    """
+    total = len(new_launches)
+    successful = 0
+    payload_mass_sum, payload_mass_count = 0.0, 0
+    delay_sum, delay_count = 0.0, 0
+    for launch_data in new_launches:
+        if launch_data.get("success") is True:
+            successful += 1
+        payload_mass = _launch_payload_mass_kg(launch_data)
+        if payload_mass is not None:
+            payload_mass_sum += payload_mass
+            payload_mass_count += 1
+        if launch_data.get("launch_delay_seconds") is not None:
+            delay_sum += launch_data["launch_delay_seconds"]
+            delay_count += 1
+
+    logger.info(f"Incrementing launch aggregates with {total} new launches...")
+    cur.execute(
+        """
+        UPDATE launch_aggregates SET
+            total_launches = total_launches + %s,
+            successful_launches = successful_launches + %s,
+            sum_payload_mass_kg = sum_payload_mass_kg + %s,
+            count_payload_mass_nonnull = count_payload_mass_nonnull + %s,
+            sum_launch_delay_seconds = sum_launch_delay_seconds + %s,
+            count_launch_delay_nonnull = count_launch_delay_nonnull + %s,
+            last_updated_utc = NOW()
+        WHERE id = 1;
+        """,
+        (total, successful, payload_mass_sum, payload_mass_count, delay_sum, delay_count),
+    )
+    if cur.rowcount == 0:
+        logger.info("No existing aggregates found; performing a full recalculation.")
+        _recalculate_aggregates(cur)
+
+def update_launch_aggregates() -> None:
+    """
+    Refreshes the `launch_aggregates` table when a run inserts no launches.
+
+    The running totals are left unchanged and only the timestamp is bumped; on
+    a fresh or rebuilt table the aggregates are calculated from `raw_launches`.
+    Runs that insert launches update the aggregates in `bulk_copy_launches`.
+    """
+    logger.info("Updating launch aggregates table...")
     try:
         with get_db_connection() as conn, get_cursor(conn) as cur:
-            cur.execute(aggregation_query)
+            _apply_aggregate_deltas(cur, [])
             logger.info("Successfully updated launch aggregates.")
     except psycopg2.Error as e:
         logger.error(f"Failed to update launch aggregates: {e}")
@@ -9,11 +9,14 @@ To run the application, execute this module directly:
     python -m src.launch_ingester.main
 """
 import logging
-from launch_ingester.processors.ingestion import run_ingestion
 
 logger = logging.getLogger(__name__)
 
 if __name__ == "__main__":
+    # Imported here so that the heavy dependencies (requests, psycopg2, pydantic)
+    # are only loaded when the pipeline actually runs.
+    from launch_ingester.processors.ingestion import run_ingestion
+
     logger.info("Application starting...")
     run_ingestion()
     logger.info("Application finished.")
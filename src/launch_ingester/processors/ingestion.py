@@ -13,10 +13,8 @@ from datetime import datetime
 
 from launch_ingester.api.client import query_launches
 from launch_ingester.database.operations import (
-    create_raw_launches_table,
-    get_latest_launch_date,
-    insert_launch_data,
-    create_launch_aggregates_table,
+    prepare_and_get_state,
+    bulk_copy_launches,
     update_launch_aggregates,
 )
 
@@ -27,21 +25,19 @@ def run_ingestion() -> None:
     """
     Runs the main ingestion process using a backfill/incremental strategy.
     
-    1. Ensures the database table exists.
+    1. Ensures the database tables exist.
     2. Checks for the most recent launch date in the database to determine
        the run mode (backfill vs. incremental).
     3. Fetches launch data from the API.
-    4. Filters out upcoming launches and any launches that are not strictly
-       newer than the latest data in the database.
-    5. Inserts the new, filtered launch data into the `raw_launches` table.
+    4. Filters out upcoming launches.
+    5. Inserts the launches that are strictly newer than the latest data in
+       the database into the `raw_launches` table.
     """
     logger.info("--- Starting ingestion process ---")
 
     try:
         # 1. Setup phase
-        create_raw_launches_table()
-        create_launch_aggregates_table()
-        latest_date = get_latest_launch_date()
+        latest_date = prepare_and_get_state()
 
         # 2. Determine API query parameters
         since_date_iso = None
@@ -58,53 +54,42 @@ def run_ingestion() -> None:
         all_launches = query_launches(since_date=since_date_iso)
 
         # 4. Perform client-side filtering
-        # First, filter for past launches to bypass an API bug.
-        past_launches = [launch for launch in all_launches if not launch.upcoming]
-
-        # Then, if incremental, filter out records that are not strictly newer.
-        if latest_date:
-            launches_to_ingest = [
-                launch
-                for launch in past_launches
-                if datetime.fromisoformat(launch.date_utc.replace("Z", "+00:00"))
-                > latest_date
-            ]
-        else:
-            launches_to_ingest = past_launches
+        # Filter for past launches to bypass an API bug. Records that are not
+        # strictly newer than the latest stored launch are filtered out by the
+        # database during the insert.
+        launches_to_ingest = [(launch, raw) for launch, raw in all_launches if not launch.upcoming]
         
         # 5. Insert data into the database
         if not launches_to_ingest:
             logger.info("No new launches to ingest. Process complete.")
-            # Even if there are no new launches, we should update the aggregates
-            # in case the underlying data has changed for some reason.
+            # Even if there are no new launches, we still touch the aggregates so
+            # that they are created on a fresh database and their timestamp is current.
             update_launch_aggregates()
             return
 
-        logger.info(f"Found {len(launches_to_ingest)} new launches to ingest. Inserting into database...")
-        for i, launch in enumerate(launches_to_ingest, 1):
-            # Calculate launch delay before inserting
+        logger.info(f"Found {len(launches_to_ingest)} candidate launches to ingest. Inserting into database...")
+        for launch, raw in launches_to_ingest:
+            # Calculate launch delay before inserting. The raw API document is
+            # what gets stored, so the enriched field is written onto it directly.
+            raw["launch_delay_seconds"] = None
             if launch.static_fire_date_utc and launch.date_utc:
                 try:
                     static_fire_time = datetime.fromisoformat(launch.static_fire_date_utc.replace("Z", "+00:00"))
                     launch_time = datetime.fromisoformat(launch.date_utc.replace("Z", "+00:00"))
                     delay = launch_time - static_fire_time
-                    launch.launch_delay_seconds = int(delay.total_seconds())
+                    raw["launch_delay_seconds"] = int(delay.total_seconds())
                 except (ValueError, TypeError) as e:
                     logger.warning(
                         f"Could not calculate launch delay for {launch.id}: {e}. "
                         f"static_fire_date_utc: {launch.static_fire_date_utc}, date_utc: {launch.date_utc}"
                     )
-                    launch.launch_delay_seconds = None
-            else:
-                launch.launch_delay_seconds = None
-
-            logger.debug(f"Inserting launch {i}/{len(launches_to_ingest)}: {launch.name} ({launch.id})")
-            insert_launch_data(launch.dict())
 
-        logger.info(f"Successfully inserted {len(launches_to_ingest)} new launch records.")
+        # The aggregates are updated from the inserted launches in the same transaction.
+        inserted_ids = bulk_copy_launches(
+            [raw for _, raw in launches_to_ingest], newer_than=latest_date
+        )
 
-        # 6. Update aggregation table
-        update_launch_aggregates()
+        logger.info(f"Successfully inserted {len(inserted_ids)} new launch records.")
 
     except Exception as e:
         logger.critical(f"An unhandled error occurred during the ingestion process: {e}", exc_info=True)
@@ -0,0 +1,21 @@
+"""
+Shared test setup.
+
+Makes the `launch_ingester` package importable from `src/` and provides
+placeholder settings so that `launch_ingester.config` can be imported without
+a `.env` file. No test connects to a real database or API.
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+for _name, _value in {
+    "POSTGRES_USER": "test_user",
+    "POSTGRES_PASSWORD": "test_password",
+    "POSTGRES_DB": "test_db",
+    "POSTGRES_HOST": "localhost",
+    "POSTGRES_PORT": "5432",
+    "API_URL": "https://api.spacexdata.com/v4/launches/query",
+}.items():
+    os.environ.setdefault(_name, _value)
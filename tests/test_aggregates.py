@@ -0,0 +1,107 @@
+"""
+Tests for the incremental aggregate helpers in `database.operations`.
+
+The Python deltas must agree with the full recalculation in SQL
+(`_recalculate_aggregates`), so these tests pin the same rules: a launch counts
+as successful only when `success` is true, a launch contributes payload mass
+only when at least one payload has a known mass, and non-object payload
+entries are ignored.
+"""
+from typing import List, Optional, Tuple
+
+from launch_ingester.database.operations import (
+    _apply_aggregate_deltas,
+    _launch_payload_mass_kg,
+)
+
+
+class StubCursor:
+    """Records executed statements and reports a fixed `rowcount`."""
+
+    def __init__(self, rowcount: int = 1):
+        self.rowcount = rowcount
+        self.executed: List[Tuple[str, Optional[tuple]]] = []
+
+    def execute(self, query: str, params: Optional[tuple] = None) -> None:
+        self.executed.append((query, params))
+
+
+# --- _launch_payload_mass_kg ---
+
+def test_payload_mass_sums_known_masses():
+    launch = {"payloads": [{"mass_kg": 1000}, {"mass_kg": 250.5}]}
+    assert _launch_payload_mass_kg(launch) == 1250.5
+
+
+def test_payload_mass_skips_null_masses():
+    launch = {"payloads": [{"mass_kg": None}, {"mass_kg": 300}, {}]}
+    assert _launch_payload_mass_kg(launch) == 300.0
+
+
+def test_payload_mass_is_none_when_all_masses_are_null():
+    launch = {"payloads": [{"mass_kg": None}, {"name": "no mass"}]}
+    assert _launch_payload_mass_kg(launch) is None
+
+
+def test_payload_mass_is_none_without_payloads():
+    assert _launch_payload_mass_kg({"payloads": []}) is None
+    assert _launch_payload_mass_kg({"payloads": None}) is None
+    assert _launch_payload_mass_kg({}) is None
+
+
+def test_payload_mass_ignores_unpopulated_payload_ids():
+    launch = {"payloads": ["5eb0e4b5b6c3bb0006eeb1e1", {"mass_kg": 20}]}
+    assert _launch_payload_mass_kg(launch) == 20.0
+
+
+def test_payload_mass_counts_zero_as_known():
+    assert _launch_payload_mass_kg({"payloads": [{"mass_kg": 0}]}) == 0.0
+
+
+# --- _apply_aggregate_deltas ---
+
+def test_deltas_match_recalculation_rules():
+    launches = [
+        {"id": "a", "success": True, "payloads": [{"mass_kg": 100}], "launch_delay_seconds": 60},
+        {"id": "b", "success": False, "payloads": [{"mass_kg": None}], "launch_delay_seconds": None},
+        {"id": "c", "success": None, "payloads": [], "launch_delay_seconds": 30},
+        {"id": "d", "payloads": [{"mass_kg": 50}, "unpopulated-id"]},
+    ]
+    cur = StubCursor(rowcount=1)
+
+    _apply_aggregate_deltas(cur, launches)
+
+    assert len(cur.executed) == 1
+    query, params = cur.executed[0]
+    assert query.strip().startswith("UPDATE launch_aggregates")
+    # total, successful, payload sum, payload count, delay sum, delay count
+    assert params == (4, 1, 150.0, 2, 90.0, 2)
+
+
+def test_only_boolean_true_counts_as_success():
+    launches = [{"success": "true"}, {"success": 1}, {"success": True}]
+    cur = StubCursor(rowcount=1)
+
+    _apply_aggregate_deltas(cur, launches)
+
+    assert cur.executed[0][1][1] == 1
+
+
+def test_no_new_launches_applies_zero_deltas():
+    cur = StubCursor(rowcount=1)
+
+    _apply_aggregate_deltas(cur, [])
+
+    assert cur.executed[0][1] == (0, 0, 0.0, 0, 0.0, 0)
+
+
+def test_missing_aggregate_row_triggers_full_recalculation_on_same_cursor():
+    cur = StubCursor(rowcount=0)
+
+    _apply_aggregate_deltas(cur, [{"success": True}])
+
+    assert len(cur.executed) == 2
+    recalculation, params = cur.executed[1]
+    assert "INSERT INTO launch_aggregates" in recalculation
+    assert "jsonb_array_elements(launch_data->'payloads')" in recalculation
+    assert params is None
@@ -0,0 +1,78 @@
+"""
+Tests for the hand-built binary COPY encoder in `database.operations`.
+
+The stream must follow PostgreSQL's binary COPY layout exactly: the 11-byte
+signature, a flags field and header extension length, then per row a 16-bit
+field count and 32-bit length-prefixed fields, and finally a -1 trailer.
+"""
+import struct
+
+import orjson
+
+from launch_ingester.database.operations import _build_copy_binary_buffer
+
+SIGNATURE = b"PGCOPY\n\xff\r\n\x00"
+
+
+def _parse_rows(data: bytes):
+    """Decodes a binary COPY stream into a list of field tuples, checking framing."""
+    assert data[:11] == SIGNATURE
+    flags, header_extension_length = struct.unpack("!ii", data[11:19])
+    assert flags == 0
+    assert header_extension_length == 0
+
+    rows = []
+    offset = 19
+    while True:
+        (field_count,) = struct.unpack("!h", data[offset:offset + 2])
+        offset += 2
+        if field_count == -1:
+            break
+        assert field_count == 2
+        fields = []
+        for _ in range(field_count):
+            (length,) = struct.unpack("!i", data[offset:offset + 4])
+            offset += 4
+            fields.append(data[offset:offset + length])
+            offset += length
+        rows.append(tuple(fields))
+
+    assert offset == len(data), "unexpected bytes after the trailer"
+    return rows
+
+
+def test_empty_input_is_header_and_trailer_only():
+    data = _build_copy_binary_buffer([]).getvalue()
+    assert data == SIGNATURE + struct.pack("!ii", 0, 0) + struct.pack("!h", -1)
+
+
+def test_rows_are_length_prefixed_id_and_jsonb():
+    launches = [
+        {"id": "5eb87cd9ffd86e000604b32a", "name": "FalconSat", "success": False},
+        {"id": "5eb87cdaffd86e000604b32b", "details": "tab\there\nnewline \\ backslash"},
+    ]
+
+    rows = _parse_rows(_build_copy_binary_buffer(launches).getvalue())
+
+    assert len(rows) == 2
+    for (launch_id, payload), launch in zip(rows, launches):
+        assert launch_id == launch["id"].encode()
+        assert payload[:1] == b"\x01"  # jsonb binary format version
+        assert payload[1:] == orjson.dumps(launch)
+        assert orjson.loads(payload[1:]) == launch
+
+
+def test_lengths_are_byte_lengths_for_non_ascii_text():
+    launch = {"id": "ñ-1", "name": "Ñave Ωmega"}
+
+    ((launch_id, payload),) = _parse_rows(_build_copy_binary_buffer([launch]).getvalue())
+
+    assert launch_id == "ñ-1".encode("utf-8")
+    assert len(launch_id) == 4
+    assert orjson.loads(payload[1:])["name"] == "Ñave Ωmega"
+
+
+def test_buffer_is_rewound_for_reading():
+    buffer = _build_copy_binary_buffer([{"id": "a"}])
+    assert buffer.tell() == 0
+    assert buffer.read(11) == SIGNATURE